@@ -1,7 +1,10 @@
 """Main FastAPI application."""
 
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from api.routes import router
 
@@ -11,16 +14,21 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
-# CORS middleware for local development
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+APP_ENV = os.getenv("APP_ENV", "dev")
+
+# CORS middleware for local development only; production skips it entirely
+if APP_ENV == "dev":
+    cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:5173")
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[o.strip() for o in cors_origins.split(",") if o.strip()],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 # Include routes
 app.include_router(router)
@@ -1,15 +1,20 @@
 """API routes for the lab assistant."""
 
 import os
-from datetime import datetime
-
-from fastapi import APIRouter, Depends, HTTPException
+import threading
+import time
+from datetime import UTC, datetime
+
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 from redis import Redis
 from rq import Queue
-from sqlalchemy import text
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.database import get_db
+from api.database import async_engine, get_db
 from api.models import Request
 from api.schemas import (
     AgentResult,
@@ -25,6 +30,22 @@ router = APIRouter()
 # Redis connection
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 
+# Statuses whose payload never changes once written by the worker
+TERMINAL_STATUSES = frozenset({RequestStatus.DONE.value, RequestStatus.FAILED.value})
+
+# Status lookup, built once so every poll hits the same compiled-SQL cache entry.
+# Fetches only the columns the response needs.
+STATUS_STMT = select(Request.id, Request.status, Request.result, Request.error).where(
+    Request.id == bindparam("rid")
+)
+
+# In-process cache of terminal request statuses, keyed by request_id
+_status_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_status_cache_lock = threading.Lock()
+
+# Last health payload and the epoch second it was built for
+_health_cache: tuple[int, bytes] = (0, b"")
+
 
 def get_redis() -> Redis:
     """Get Redis connection."""
@@ -36,10 +57,44 @@ def get_queue() -> Queue:
     return Queue("lab_requests", connection=get_redis())
 
 
+def enqueue_request(request_id: str, at_front: bool) -> None:
+    """Enqueue a request for the worker (blocking Redis call)."""
+    queue = get_queue()
+    queue.enqueue(
+        "worker.tasks.process_request",
+        request_id,
+        job_id=request_id,
+        job_timeout="5m",
+        at_front=at_front,
+    )
+
+
+def check_redis_services() -> dict[str, str]:
+    """Check Redis and queue health (blocking Redis calls)."""
+    services = {}
+
+    # Check Redis
+    try:
+        redis = get_redis()
+        redis.ping()
+        services["redis"] = "healthy"
+    except Exception as e:
+        services["redis"] = f"unhealthy: {str(e)}"
+
+    # Check queue
+    try:
+        queue = get_queue()
+        services["queue"] = f"healthy ({len(queue)} jobs pending)"
+    except Exception as e:
+        services["queue"] = f"unhealthy: {str(e)}"
+
+    return services
+
+
 @router.post("/requests", response_model=LabRequestResponse, status_code=201)
-def create_request(
+async def create_request(
     request_data: LabRequestCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> LabRequestResponse:
     """
     Submit a new lab request for async processing.
@@ -53,16 +108,13 @@ def create_request(
         status=RequestStatus.QUEUED.value,
     )
     db.add(db_request)
-    db.commit()
-    db.refresh(db_request)
+    await db.commit()
+    await db.refresh(db_request)
 
-    # Enqueue the task
-    queue = get_queue()
-    queue.enqueue(
-        "worker.tasks.process_request",
+    # Enqueue the task off the event loop
+    await run_in_threadpool(
+        enqueue_request,
         db_request.id,
-        job_id=db_request.id,
-        job_timeout="5m",
         at_front=(request_data.priority == "high"),
     )
 
@@ -73,68 +125,83 @@ def create_request(
 
 
 @router.get("/requests/{request_id}", response_model=LabRequestStatus)
-def get_request_status(
+async def get_request_status(
     request_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> LabRequestStatus:
     """
     Get the status and result of a lab request.
 
     Returns the current status and, if complete, the agent's result.
+    Finished requests are served from an in-process cache.
     """
-    db_request = db.query(Request).filter(Request.id == request_id).first()
+    with _status_cache_lock:
+        cached = _status_cache.get(request_id)
+    if cached is not None:
+        return cached
 
-    if not db_request:
+    row = (await db.execute(STATUS_STMT, {"rid": request_id})).one_or_none()
+
+    if row is None:
         raise HTTPException(status_code=404, detail="Request not found")
 
-    # Parse result if present
+    # Result was validated by the worker before it was stored
     result = None
-    if db_request.result:
-        result = AgentResult(**db_request.result)
+    if row.result:
+        result = AgentResult.model_construct(**row.result)
 
-    return LabRequestStatus(
-        request_id=db_request.id,
-        status=RequestStatus(db_request.status),
+    # Fields are already typed here, so skip re-validation
+    request_status = LabRequestStatus.model_construct(
+        request_id=row.id,
+        status=RequestStatus(row.status),
         result=result,
-        error=db_request.error,
+        error=row.error,
     )
 
+    # Queued/running requests bypass the cache so progress stays visible
+    if row.status in TERMINAL_STATUSES:
+        with _status_cache_lock:
+            _status_cache[request_id] = request_status
+
+    return request_status
+
 
 @router.get("/health", response_model=HealthResponse)
-def health_check(db: Session = Depends(get_db)) -> HealthResponse:
+async def health_check() -> Response:
     """
     Health check endpoint.
 
     Returns the status of the API and its dependent services.
+    Results are reused for the rest of the current second.
     """
+    global _health_cache
+
+    now = int(time.time())
+    if _health_cache[0] == now:
+        return Response(content=_health_cache[1], media_type="application/json")
+
     services = {}
 
-    # Check database
+    # Check database on a bare pooled connection; no ORM session is needed
     try:
-        db.execute(text("SELECT 1"))
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
         services["database"] = "healthy"
     except Exception as e:
         services["database"] = f"unhealthy: {str(e)}"
 
-    # Check Redis
-    try:
-        redis = get_redis()
-        redis.ping()
-        services["redis"] = "healthy"
-    except Exception as e:
-        services["redis"] = f"unhealthy: {str(e)}"
-
-    # Check queue
-    try:
-        queue = get_queue()
-        services["queue"] = f"healthy ({len(queue)} jobs pending)"
-    except Exception as e:
-        services["queue"] = f"unhealthy: {str(e)}"
+    # Check Redis and queue off the event loop
+    services.update(await run_in_threadpool(check_redis_services))
 
     overall_status = "healthy" if all("healthy" in v for v in services.values()) else "degraded"
 
-    return HealthResponse(
-        status=overall_status,
-        timestamp=datetime.utcnow(),
-        services=services,
+    payload = orjson.dumps(
+        {
+            "status": overall_status,
+            "timestamp": datetime.fromtimestamp(now, tz=UTC).isoformat(),
+            "services": services,
+        }
     )
+    _health_cache = (now, payload)
+
+    return Response(content=payload, media_type="application/json")
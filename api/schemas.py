@@ -1,12 +1,17 @@
 """Pydantic schemas for request/response validation."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 
+def _utcnow() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(UTC)
+
+
 class Priority(str, Enum):
     """Request priority levels."""
 
@@ -49,6 +54,7 @@ class LabRequestResponse(BaseModel):
     status: RequestStatus = Field(..., description="Current request status")
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -56,7 +62,7 @@ class LabRequestResponse(BaseModel):
                     "status": "queued",
                 }
             ]
-        }
+        },
     }
 
 
@@ -69,6 +75,8 @@ class AgentResult(BaseModel):
         default_factory=list, description="Source citations (file names or incident IDs)"
     )
 
+    model_config = {"frozen": True}
+
 
 class LabRequestStatus(BaseModel):
     """Schema for request status response."""
@@ -79,6 +87,7 @@ class LabRequestStatus(BaseModel):
     error: str | None = Field(None, description="Error message if failed")
 
     model_config = {
+        "frozen": True,
         "json_schema_extra": {
             "examples": [
                 {
@@ -96,7 +105,7 @@ class LabRequestStatus(BaseModel):
                     "error": None,
                 }
             ]
-        }
+        },
     }
 
 
@@ -108,6 +117,8 @@ class HealthResponse(BaseModel):
     timestamp: datetime = Field(..., description="Current timestamp")
     services: dict[str, str] = Field(..., description="Status of dependent services")
 
+    model_config = {"frozen": True}
+
 
 # Agent internal schemas
 class PlanStep(BaseModel):
@@ -118,6 +129,8 @@ class PlanStep(BaseModel):
     tool: str | None = Field(None, description="Tool to use (search_docs or query_incidents)")
     tool_input: str | None = Field(None, description="Input for the tool")
 
+    model_config = {"frozen": True}
+
 
 class AgentPlan(BaseModel):
     """Schema for the agent's execution plan."""
@@ -125,6 +138,8 @@ class AgentPlan(BaseModel):
     reasoning: str = Field(..., description="Reasoning behind the plan")
     steps: list[PlanStep] = Field(..., description="List of steps to execute")
 
+    model_config = {"frozen": True}
+
 
 class ToolCall(BaseModel):
     """Schema for recording a tool call."""
@@ -132,4 +147,6 @@ class ToolCall(BaseModel):
     tool: str = Field(..., description="Tool name")
     input: str = Field(..., description="Tool input")
     output: Any = Field(..., description="Tool output")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
+
+    model_config = {"frozen": True}
@@ -4,10 +4,24 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
+import httpx
+
 from api.schemas import AgentPlan, AgentResult
-from worker.agent.executor import _synthesize_deterministic, execute_plan
+from worker.agent.executor import (
+    LLM_CACHE_TTL,
+    _is_retryable,
+    _synthesize_deterministic,
+    _synthesize_llm,
+    execute_plan,
+)
+from worker.agent.llm import LLM_API_URL, extract_output_text
 from worker.agent.planner import _extract_keywords, _needs_docs, _needs_incidents, create_plan
-from worker.agent.tools import query_incidents, search_docs
+from worker.agent.tools import (
+    query_incidents,
+    query_incidents_batch,
+    search_docs,
+    search_docs_batch,
+)
 
 # Ensure we're using deterministic planner
 os.environ["USE_REAL_LLM"] = "false"
@@ -59,6 +73,24 @@ class TestPlanner:
         assert "how" not in keywords
         assert "the" not in keywords
 
+    def test_extract_output_text(self):
+        """extract_output_text should return the first output_text part."""
+        payload = {
+            "output": [
+                {"type": "reasoning", "content": None},
+                {
+                    "type": "message",
+                    "content": [
+                        {"type": "refusal", "text": "ignored"},
+                        {"type": "output_text", "text": '{"summary": "ok"}'},
+                    ],
+                },
+            ]
+        }
+        assert extract_output_text(payload) == '{"summary": "ok"}'
+        assert extract_output_text({"output": None, "output_text": "fallback"}) == "fallback"
+        assert extract_output_text({}) == ""
+
 
 class TestExecutor:
     """Tests for the executor module."""
@@ -113,6 +145,65 @@ class TestExecutor:
         assert "INC-001" in result.sources
         assert result.summary
 
+    def test_synthesize_llm_cache_hit_skips_request(self):
+        """_synthesize_llm should return a cached result without calling the LLM."""
+        cached = AgentResult(summary="Cached", steps=["a"], sources=["INC-001"])
+        with (
+            patch("worker.agent.executor.LLM_API_KEY", "test-key"),
+            patch("worker.agent.executor._llm_cache") as mock_cache,
+            patch("worker.agent.executor._post_llm") as mock_post,
+        ):
+            mock_cache.get.return_value = cached.model_dump_json().encode()
+            result = _synthesize_llm("test", [], [])
+        assert result == cached
+        mock_post.assert_not_called()
+
+    def test_synthesize_llm_cache_miss_stores_result(self):
+        """_synthesize_llm should call the LLM on a miss and cache the parsed result."""
+        llm_output = '{"summary": "Fresh", "steps": ["b"], "sources": ["runbook.md"]}'
+        with (
+            patch("worker.agent.executor.LLM_API_KEY", "test-key"),
+            patch("worker.agent.executor._llm_cache") as mock_cache,
+            patch("worker.agent.executor._post_llm") as mock_post,
+        ):
+            mock_cache.get.return_value = None
+            mock_post.return_value = {"output_text": llm_output}
+            result = _synthesize_llm("test", [], [])
+        assert result.summary == "Fresh"
+        mock_post.assert_called_once()
+        mock_cache.set.assert_called_once()
+        args, kwargs = mock_cache.set.call_args
+        assert args[1] == result.model_dump_json()
+        assert kwargs == {"ex": LLM_CACHE_TTL}
+
+    def test_synthesize_llm_cache_error_still_calls_llm(self):
+        """A failing cache lookup should not block LLM synthesis."""
+        llm_output = '{"summary": "Fresh", "steps": [], "sources": []}'
+        with (
+            patch("worker.agent.executor.LLM_API_KEY", "test-key"),
+            patch("worker.agent.executor._llm_cache") as mock_cache,
+            patch("worker.agent.executor._post_llm") as mock_post,
+        ):
+            mock_cache.get.side_effect = ConnectionError("redis down")
+            mock_post.return_value = {"output_text": llm_output}
+            result = _synthesize_llm("test", [], [])
+        assert result.summary == "Fresh"
+        mock_post.assert_called_once()
+
+    def test_is_retryable(self):
+        """_is_retryable should retry rate limits, server and transport errors only."""
+        request = httpx.Request("POST", LLM_API_URL)
+
+        def status_error(code: int) -> httpx.HTTPStatusError:
+            response = httpx.Response(code, request=request)
+            return httpx.HTTPStatusError(str(code), request=request, response=response)
+
+        assert _is_retryable(status_error(429))
+        assert _is_retryable(status_error(503))
+        assert _is_retryable(httpx.ConnectError("refused", request=request))
+        assert not _is_retryable(status_error(400))
+        assert not _is_retryable(status_error(401))
+
 
 class TestTools:
     """Tests for the tools module."""
@@ -143,6 +234,15 @@ class TestTools:
             results = search_docs("xyznonexistent12345")
         assert results == []
 
+    def test_search_docs_batch_matches_single_queries(self):
+        """search_docs_batch should return one result list per query."""
+        runbooks_dir = Path(__file__).parent.parent / "data" / "runbooks"
+        queries = ["database connection pool", "xyznonexistent12345", "deployment rollback"]
+        with patch("worker.agent.tools.RUNBOOKS_DIR", runbooks_dir):
+            batched = search_docs_batch(queries)
+            single = [search_docs(q) for q in queries]
+        assert batched == single
+
     def test_query_incidents_returns_list(self, db_session):
         """query_incidents should return a list."""
         results = query_incidents("database", db_session)
@@ -165,6 +265,18 @@ class TestTools:
             assert "severity" in first
             assert "status" in first
 
+    def test_query_incidents_batch_matches_single_queries(self, db_session):
+        """query_incidents_batch should return one result list per query."""
+        queries = ["connection pool", "", "redis failover"]
+        batched = query_incidents_batch(queries, db_session)
+        single = [query_incidents(q, db_session) for q in queries]
+        assert len(batched) == len(queries)
+        assert batched == single
+
+    def test_query_incidents_batch_empty(self, db_session):
+        """query_incidents_batch should not query for an empty batch."""
+        assert query_incidents_batch([], db_session) == []
+
 
 class TestEndToEnd:
     """End-to-end tests for the agent workflow."""
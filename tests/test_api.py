@@ -1,5 +1,7 @@
 """Tests for API endpoints."""
 
+from unittest.mock import patch
+
 from fastapi import status
 
 
@@ -19,6 +21,20 @@ class TestHealthEndpoint:
         assert "services" in data
         assert "timestamp" in data
 
+    def test_health_reuses_payload_within_same_second(self, test_client):
+        """Health checks within one second should return the cached payload."""
+        services = {"redis": "healthy", "queue": "healthy (0 jobs pending)"}
+        with (
+            patch("api.routes.time") as mock_time,
+            patch("api.routes.check_redis_services", return_value=services) as mock_check,
+        ):
+            mock_time.time.return_value = 1_700_000_000.5
+            first = test_client.get("/health")
+            second = test_client.get("/health")
+        mock_check.assert_called_once()
+        assert first.content == second.content
+        assert first.json()["timestamp"] == "2023-11-14T22:13:20+00:00"
+
 
 class TestRootEndpoint:
     """Tests for the root endpoint."""
@@ -92,6 +108,65 @@ class TestRequestsEndpoint:
         assert data["request_id"] == request_id
         assert data["status"] in ["queued", "running", "done", "failed"]
 
+    def test_get_request_serves_terminal_status_from_cache(self, test_client):
+        """Finished requests should be served from the status cache."""
+        from api.routes import _status_cache
+        from api.schemas import AgentResult, LabRequestStatus, RequestStatus
+
+        request_id = "11111111-1111-1111-1111-111111111111"
+        _status_cache[request_id] = LabRequestStatus(
+            request_id=request_id,
+            status=RequestStatus.DONE,
+            result=AgentResult(summary="Cached summary"),
+        )
+        try:
+            response = test_client.get(f"/requests/{request_id}")
+        finally:
+            _status_cache.pop(request_id, None)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["status"] == "done"
+        assert data["result"]["summary"] == "Cached summary"
+
+    def test_get_request_does_not_cache_queued_status(self, test_client, sample_request_data):
+        """Queued requests should be read from the database on every poll."""
+        from api.database import get_db
+        from api.main import app
+        from api.routes import _status_cache
+
+        # Keep the job off the queue so no worker can move it past queued
+        with patch("api.routes.enqueue_request"):
+            create_response = test_client.post("/requests", json=sample_request_data)
+        request_id = create_response.json()["request_id"]
+
+        execute_calls = []
+
+        async def counting_get_db():
+            async for db in get_db():
+                original_execute = db.execute
+
+                async def execute(*args, **kwargs):
+                    execute_calls.append(args)
+                    return await original_execute(*args, **kwargs)
+
+                db.execute = execute
+                yield db
+
+        app.dependency_overrides[get_db] = counting_get_db
+        try:
+            first = test_client.get(f"/requests/{request_id}")
+            second = test_client.get(f"/requests/{request_id}")
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_200_OK
+        assert first.json()["status"] == "queued"
+        assert second.json()["status"] == "queued"
+        assert len(execute_calls) == 2
+        assert request_id not in _status_cache
+
 
 class TestRequestSchemas:
     """Tests for request/response schema validation."""
@@ -1,17 +1,76 @@
 """Executor module that runs the plan and produces results."""
 
+import hashlib
 import logging
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 import httpx
+import orjson
+from redis import Redis
 from sqlalchemy.orm import Session
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from api.schemas import AgentPlan, AgentResult, ToolCall
-from worker.agent.tools import query_incidents, search_docs
+from worker.agent.llm import LLM_API_URL, extract_output_text
+from worker.agent.tools import query_incidents_batch, search_docs_batch
 
 logger = logging.getLogger(__name__)
 
+# LLM settings, resolved once at import
+USE_REAL_LLM = os.getenv("USE_REAL_LLM", "false").lower() == "true"
+LLM_API_KEY = os.getenv("LLM_API_KEY")
+LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4")
+
+# Shared client so repeated LLM calls reuse the TLS connection
+_LLM_CLIENT = httpx.Client(
+    http2=True,
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+)
+
+# Runs runbook search alongside the incident query; threads start on first use
+_TOOL_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-tools")
+
+# Synthesis results are cached in Redis, since RQ runs each job in a fresh work horse
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "86400"))
+_llm_cache = Redis.from_url(REDIS_URL)
+
+
+def _llm_cache_key(model: str, context: str) -> str:
+    """Build the cache key for a synthesis prompt."""
+    digest = hashlib.blake2b(f"{model}\0{context}".encode(), digest_size=16).hexdigest()
+    return f"llm:synthesis:{digest}"
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry transport errors, rate limits and server errors."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+@retry(
+    retry=retry_if_exception(_is_retryable),
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.5, max=4),
+    reraise=True,
+)
+def _post_llm(api_key: str, payload: dict) -> dict:
+    """POST a request to the LLM API and return the decoded response."""
+    response = _LLM_CLIENT.post(
+        LLM_API_URL,
+        headers={
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        },
+        json=payload,
+    )
+    response.raise_for_status()
+    return response.json()
+
 
 def _synthesize_deterministic(
     text: str,
@@ -24,40 +83,44 @@ def _synthesize_deterministic(
     """
     summary_parts = []
     steps = []
-    sources = []
+    sources: set[str] = set()
 
     # Process documentation results
     if doc_results:
         summary_parts.append("Based on the documentation:")
-        for doc in doc_results[:3]:
+        for doc in islice(doc_results, 3):
             summary_parts.append(f"- {doc['title']}: {doc['snippet'][:100]}...")
-            steps.extend(doc.get("key_points", [])[:2])
-            sources.append(doc["filename"])
+            key_points = doc.get("key_points")
+            if key_points:
+                steps.extend(islice(key_points, 2))
+            sources.add(doc["filename"])
 
     # Process incident results
     if incident_results:
         summary_parts.append("\nRelevant past incidents:")
-        for inc in incident_results[:3]:
+        for inc in islice(incident_results, 3):
             summary_parts.append(f"- {inc['id']}: {inc['title']}")
-            if inc.get("resolution"):
-                steps.append(f"From {inc['id']}: {inc['resolution'][:100]}")
-            sources.append(inc["id"])
+            resolution = inc.get("resolution")
+            if resolution:
+                steps.append(f"From {inc['id']}: {resolution[:100]}")
+            sources.add(inc["id"])
 
     # Default fallback if no results
     if not summary_parts:
         summary_parts = ["No specific documentation or incidents found for this query."]
         steps = ["Please provide more details about your request."]
 
-    summary = " ".join(summary_parts) if summary_parts else "Unable to find relevant information."
+    summary = " ".join(summary_parts)
 
     # Ensure we have at least one step
     if not steps:
         steps = ["Review the sources listed below for more details."]
 
-    return AgentResult(
+    # Inputs are built above from trusted tool output, so skip validation
+    return AgentResult.model_construct(
         summary=summary,
-        steps=steps[:5],  # Limit to 5 steps
-        sources=list(set(sources)),  # Deduplicate sources
+        steps=steps if len(steps) <= 5 else steps[:5],  # Limit to 5 steps
+        sources=list(sources),
     )
 
 
@@ -70,8 +133,8 @@ def _synthesize_llm(
     Synthesize results using an LLM.
     Requires LLM_API_KEY environment variable.
     """
-    api_key = os.getenv("LLM_API_KEY")
-    model = os.getenv("LLM_MODEL", "gpt-4")
+    api_key = LLM_API_KEY
+    model = LLM_MODEL
 
     if not api_key:
         logger.warning("LLM_API_KEY not set, falling back to deterministic synthesis")
@@ -97,43 +160,44 @@ Respond with JSON:
   "sources": ["filename.md", "INC-XXX", ...]
 }}"""
 
-    def _extract_output_text(payload: dict) -> str:
-        for item in payload.get("output", []):
-            if item.get("type") == "message":
-                for part in item.get("content", []):
-                    if part.get("type") == "output_text":
-                        return part.get("text", "")
-        output_text = payload.get("output_text")
-        return output_text if isinstance(output_text, str) else ""
+    cache_key = _llm_cache_key(model, context)
+    try:
+        cached = _llm_cache.get(cache_key)
+        if cached is not None:
+            return AgentResult.model_validate_json(cached)
+    except Exception as e:
+        logger.warning(f"LLM cache lookup failed: {e}")
 
     try:
-        response = httpx.post(
-            "https://api.openai.com/v1/responses",
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
+        data = _post_llm(
+            api_key,
+            {
                 "model": model,
                 "input": context,
                 "temperature": 0.3,
                 "text": {"format": {"type": "json_object"}},
             },
-            timeout=30,
         )
-        response.raise_for_status()
-        data = response.json()
-        content = _extract_output_text(data)
+        content = extract_output_text(data)
         if not content:
             raise ValueError("Empty response content from LLM synthesis")
-        import json
-
-        result_data = json.loads(content)
-        return AgentResult(**result_data)
+        result_data = orjson.loads(content)
+        result = AgentResult(**result_data)
     except Exception as e:
         logger.error(f"LLM synthesis failed: {e}, falling back to deterministic")
         return _synthesize_deterministic(text, doc_results, incident_results)
 
+    try:
+        _llm_cache.set(cache_key, result.model_dump_json(), ex=LLM_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"LLM cache store failed: {e}")
+
+    return result
+
+
+# Synthesizer selected once from USE_REAL_LLM
+_synthesize = _synthesize_llm if USE_REAL_LLM else _synthesize_deterministic
+
 
 def execute_plan(
     text: str,
@@ -155,31 +219,51 @@ def execute_plan(
     doc_results = []
     incident_results = []
 
-    # Execute each step in the plan
+    # Gather tool inputs up front so each tool runs as a single batch
+    docs_inputs = [s.tool_input for s in plan.steps if s.tool == "search_docs" and s.tool_input]
+    incidents_inputs = [
+        s.tool_input for s in plan.steps if s.tool == "query_incidents" and s.tool_input
+    ]
+
+    if docs_inputs:
+        logger.info(f"Executing search_docs for {len(docs_inputs)} input(s)")
+    if incidents_inputs:
+        logger.info(f"Executing query_incidents for {len(incidents_inputs)} input(s)")
+
+    if docs_inputs and incidents_inputs:
+        # Runbook search only reads files, so it runs in a thread while the
+        # incident query uses the session on this thread
+        docs_future = _TOOL_POOL.submit(search_docs_batch, docs_inputs)
+        incidents_batch = query_incidents_batch(incidents_inputs, db)
+        docs_batch = docs_future.result()
+    else:
+        docs_batch = search_docs_batch(docs_inputs)
+        incidents_batch = query_incidents_batch(incidents_inputs, db)
+
+    docs_outputs = iter(docs_batch)
+    incidents_outputs = iter(incidents_batch)
+
+    # Record tool calls in plan order
     for step in plan.steps:
         if step.tool == "search_docs" and step.tool_input:
-            logger.info(f"Executing search_docs: {step.tool_input}")
-            results = search_docs(step.tool_input)
+            results = next(docs_outputs)
             doc_results.extend(results)
             tool_calls.append(
                 ToolCall(
                     tool="search_docs",
                     input=step.tool_input,
                     output=results,
-                    timestamp=datetime.utcnow(),
                 )
             )
 
         elif step.tool == "query_incidents" and step.tool_input:
-            logger.info(f"Executing query_incidents: {step.tool_input}")
-            results = query_incidents(step.tool_input, db)
+            results = next(incidents_outputs)
             incident_results.extend(results)
             tool_calls.append(
                 ToolCall(
                     tool="query_incidents",
                     input=step.tool_input,
                     output=results,
-                    timestamp=datetime.utcnow(),
                 )
             )
 
@@ -188,11 +272,6 @@ def execute_plan(
             logger.info("Synthesis step - combining results")
 
     # Synthesize final result
-    use_llm = os.getenv("USE_REAL_LLM", "false").lower() == "true"
-
-    if use_llm:
-        result = _synthesize_llm(text, doc_results, incident_results)
-    else:
-        result = _synthesize_deterministic(text, doc_results, incident_results)
+    result = _synthesize(text, doc_results, incident_results)
 
     return result, tool_calls
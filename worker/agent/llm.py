@@ -0,0 +1,15 @@
+"""Helpers shared by the planner and executor for LLM API calls."""
+
+LLM_API_URL = "https://api.openai.com/v1/responses"
+
+
+def extract_output_text(payload: dict) -> str:
+    """Return the first output_text part of a Responses API payload."""
+    for item in payload.get("output") or ():
+        if item.get("type") != "message":
+            continue
+        for part in item.get("content") or ():
+            if part.get("type") == "output_text":
+                return part.get("text", "")
+    output_text = payload.get("output_text")
+    return output_text if isinstance(output_text, str) else ""
@@ -8,6 +8,7 @@ import re
 import httpx
 
 from api.schemas import AgentPlan, PlanStep
+from worker.agent.llm import LLM_API_URL, extract_output_text
 
 logger = logging.getLogger(__name__)
 
@@ -211,18 +212,9 @@ Example response:
   ]
 }}"""
 
-    def _extract_output_text(payload: dict) -> str:
-        for item in payload.get("output", []):
-            if item.get("type") == "message":
-                for part in item.get("content", []):
-                    if part.get("type") == "output_text":
-                        return part.get("text", "")
-        output_text = payload.get("output_text")
-        return output_text if isinstance(output_text, str) else ""
-
     try:
         response = httpx.post(
-            "https://api.openai.com/v1/responses",
+            LLM_API_URL,
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
@@ -237,7 +229,7 @@ Example response:
         )
         response.raise_for_status()
         data = response.json()
-        content = _extract_output_text(data)
+        content = extract_output_text(data)
         if not content:
             raise ValueError("Empty response content from LLM planner")
         plan_data = json.loads(content)
@@ -6,7 +6,7 @@ import re
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import or_
+from sqlalchemy import Select, literal, or_, select, union_all
 from sqlalchemy.orm import Session
 
 from api.models import Incident
@@ -32,8 +32,26 @@ def search_docs(query: str) -> list[dict[str, Any]]:
     Returns:
         List of matching documents with title, filename, snippet, and key_points
     """
-    results = []
-    keywords = set(re.findall(r"\b[a-zA-Z]{3,}\b", query.lower()))
+    return search_docs_batch([query])[0]
+
+
+def search_docs_batch(queries: list[str]) -> list[list[dict[str, Any]]]:
+    """
+    Search documentation/runbooks for several queries at once.
+
+    Each runbook is read from disk once and scored against every query.
+
+    Args:
+        queries: Search query strings
+
+    Returns:
+        One list of matching documents per query, in input order
+    """
+    results: list[list[dict[str, Any]]] = [[] for _ in queries]
+    keyword_sets = [set(re.findall(r"\b[a-zA-Z]{3,}\b", query.lower())) for query in queries]
+
+    if not queries:
+        return results
 
     if not RUNBOOKS_DIR.exists():
         logger.warning(f"Runbooks directory not found: {RUNBOOKS_DIR}")
@@ -43,39 +61,45 @@ def search_docs(query: str) -> list[dict[str, Any]]:
         try:
             content = md_file.read_text(encoding="utf-8")
             content_lower = content.lower()
-
-            # Calculate relevance score based on keyword matches
-            matches = sum(1 for kw in keywords if kw in content_lower)
-
-            if matches > 0:
-                # Extract title (first # heading)
-                title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-                title = title_match.group(1) if title_match else md_file.stem
-
-                # Extract snippet around first keyword match
-                snippet = _extract_snippet(content, keywords)
-
-                # Extract key points (bullet points)
-                key_points = _extract_key_points(content)
-
-                results.append(
-                    {
-                        "filename": md_file.name,
-                        "title": title,
-                        "snippet": snippet,
-                        "key_points": key_points,
-                        "relevance_score": matches,
-                    }
-                )
+            title = None
+            key_points = None
+
+            for query_results, keywords in zip(results, keyword_sets, strict=True):
+                # Calculate relevance score based on keyword matches
+                matches = sum(1 for kw in keywords if kw in content_lower)
+
+                if matches > 0:
+                    if title is None:
+                        # Extract title (first # heading)
+                        title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
+                        title = title_match.group(1) if title_match else md_file.stem
+
+                        # Extract key points (bullet points)
+                        key_points = _extract_key_points(content)
+
+                    # Extract snippet around first keyword match
+                    snippet = _extract_snippet(content, keywords)
+
+                    query_results.append(
+                        {
+                            "filename": md_file.name,
+                            "title": title,
+                            "snippet": snippet,
+                            "key_points": key_points,
+                            "relevance_score": matches,
+                        }
+                    )
 
         except Exception as e:
             logger.error(f"Error reading {md_file}: {e}")
             continue
 
-    # Sort by relevance score
-    results.sort(key=lambda x: x["relevance_score"], reverse=True)
+    for i, query_results in enumerate(results):
+        # Sort by relevance score
+        query_results.sort(key=lambda x: x["relevance_score"], reverse=True)
+        results[i] = query_results[:5]  # Return top 5 results
 
-    return results[:5]  # Return top 5 results
+    return results
 
 
 def _extract_snippet(content: str, keywords: set[str], context_chars: int = 200) -> str:
@@ -131,33 +155,55 @@ def query_incidents(query: str, db: Session) -> list[dict[str, Any]]:
     Returns:
         List of matching incidents with their details
     """
-    results = []
-    keywords = set(re.findall(r"\b[a-zA-Z]{3,}\b", query.lower()))
+    return query_incidents_batch([query], db)[0]
+
+
+def _incident_select(input_idx: int, keywords: set[str]) -> Select:
+    """Build the incident search for one input, tagged with its input index."""
+    stmt = select(literal(input_idx).label("input_idx"), *Incident.__table__.c)
 
     if not keywords:
         # If no keywords, return recent incidents
-        incidents = db.query(Incident).order_by(Incident.created_at.desc()).limit(5).all()
-    else:
-        # Build search conditions
-        conditions = []
-        for kw in keywords:
-            pattern = f"%{kw}%"
-            conditions.append(Incident.title.ilike(pattern))
-            conditions.append(Incident.description.ilike(pattern))
-            conditions.append(Incident.service.ilike(pattern))
-            conditions.append(Incident.root_cause.ilike(pattern))
-            conditions.append(Incident.resolution.ilike(pattern))
-
-        incidents = (
-            db.query(Incident)
-            .filter(or_(*conditions))
-            .order_by(Incident.created_at.desc())
-            .limit(10)
-            .all()
-        )
+        return stmt.order_by(Incident.created_at.desc()).limit(5)
+
+    # Build search conditions
+    conditions = []
+    for kw in keywords:
+        pattern = f"%{kw}%"
+        conditions.append(Incident.title.ilike(pattern))
+        conditions.append(Incident.description.ilike(pattern))
+        conditions.append(Incident.service.ilike(pattern))
+        conditions.append(Incident.root_cause.ilike(pattern))
+        conditions.append(Incident.resolution.ilike(pattern))
+
+    return stmt.where(or_(*conditions)).order_by(Incident.created_at.desc()).limit(10)
+
+
+def query_incidents_batch(queries: list[str], db: Session) -> list[list[dict[str, Any]]]:
+    """
+    Query the incidents database for several queries in one round-trip.
+
+    Each query keeps its own search conditions and limit; the per-query
+    selects are combined with UNION ALL and split back apart by input index.
+
+    Args:
+        queries: Search query strings
+        db: Database session
+
+    Returns:
+        One list of matching incidents per query, in input order
+    """
+    results: list[list[dict[str, Any]]] = [[] for _ in queries]
+    keyword_sets = [set(re.findall(r"\b[a-zA-Z]{3,}\b", query.lower())) for query in queries]
 
-    for incident in incidents:
-        results.append(
+    if not queries:
+        return results
+
+    selects = [_incident_select(i, keywords) for i, keywords in enumerate(keyword_sets)]
+    stmt = selects[0] if len(selects) == 1 else union_all(*selects)
+
+    for incident in db.execute(stmt):
+        results[incident.input_idx].append(
             {
                 "id": incident.id,
                 "title": incident.title,
@@ -173,18 +219,22 @@ def query_incidents(query: str, db: Session) -> list[dict[str, Any]]:
             }
         )
 
-    # Calculate relevance scores
-    for result in results:
-        score = 0
-        searchable_text = " ".join(
-            str(v).lower() for v in result.values() if v and isinstance(v, str)
+    for i, (query_results, keywords) in enumerate(zip(results, keyword_sets, strict=True)):
+        # Calculate relevance scores
+        for result in query_results:
+            score = 0
+            searchable_text = " ".join(
+                str(v).lower() for v in result.values() if v and isinstance(v, str)
+            )
+            for kw in keywords:
+                if kw in searchable_text:
+                    score += 1
+            result["relevance_score"] = score
+
+        # Sort by relevance then recency
+        query_results.sort(
+            key=lambda x: (x.get("relevance_score", 0), x.get("created_at", "")), reverse=True
         )
-        for kw in keywords:
-            if kw in searchable_text:
-                score += 1
-        result["relevance_score"] = score
-
-    # Sort by relevance then recency
-    results.sort(key=lambda x: (x.get("relevance_score", 0), x.get("created_at", "")), reverse=True)
+        results[i] = query_results[:5]  # Return top 5 results
 
-    return results[:5]  # Return top 5 results
+    return results